@@ -56,6 +56,7 @@ MARKERS = {
     "cubic_root": "test requires the compiled cubic root finder",
     "iapws": "test requires the compiled IAPWS95 property package",
     "initialization": "test of initialization methods. These generally require a solver as well",
+    "slow": "long-running tests that may be deselected for quick feedback runs",
     "solver": "test requires a solver",
     "ui": "tests of an aspect of the ui",
     "unit": "quick tests that do not require a solver, must run in <2s",
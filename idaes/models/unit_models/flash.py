@@ -15,7 +15,7 @@ Standard IDAES flash model.
 """
 # Import Python libraries
 import logging
-from pandas import DataFrame
+import sys
 
 # Import Pyomo libraries
 from pyomo.environ import Constraint, Reference
@@ -39,6 +39,7 @@ from idaes.models.unit_models.separator import (
 )
 
 from idaes.core.util.config import is_physical_parameter_block
+from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.util.units_of_measurement import report_quantity
 
 
@@ -49,6 +50,14 @@ __author__ = "Andrew Lee, Jaffer Ghouse"
 logger = logging.getLogger("idaes.unit_model")
 
 
+# Static portion of the Separator configuration shared by all Flash units;
+# the Separator config domains copy these values on assignment
+_SEPARATOR_STATIC_ARGS = {
+    "outlet_list": ["Vap", "Liq"],
+    "split_basis": SplittingType.phaseFlow,
+}
+
+
 @declare_process_block_class("Flash")
 class FlashData(UnitModelBlockData):
     """
@@ -216,6 +225,12 @@ see property package for documentation.}""",
         ),
     )
 
+    # Stream table labels for the outlet ports used under ideal separation
+    _STREAM_ATTR_MAP = (
+        ("Vapor Outlet", "vap_outlet"),
+        ("Liquid Outlet", "liq_outlet"),
+    )
+
     def build(self):
         """
         Begin building model (pre-DAE transformation).
@@ -227,7 +242,7 @@ see property package for documentation.}""",
             None
         """
         # Call UnitModel.build to setup dynamics
-        super(FlashData, self).build()
+        super().build()
 
         # Build Control Volume
         self.control_volume = ControlVolume0DBlock(
@@ -237,6 +252,17 @@ see property package for documentation.}""",
             property_package_args=self.config.property_package_args,
         )
 
+        # Separation requires multiple phases, so check this before
+        # assembling the rest of the unit
+        params = self.control_volume.config.property_package
+        if len(params.phase_list) < 2:
+            raise ConfigurationError(
+                "{} Flash units must be used with property packages which "
+                "define at least two phases, as a single phase leaves "
+                "nothing to separate. Please check the property package "
+                "provided.".format(self.name)
+            )
+
         self.control_volume.add_state_blocks(has_phase_equilibrium=True)
 
         self.control_volume.add_material_balances(
@@ -256,21 +282,19 @@ see property package for documentation.}""",
         # Add Ports
         self.add_inlet_port()
 
-        split_map = {}
-        for p in self.control_volume.properties_in.phase_list:
-            p_obj = self.control_volume.properties_in.params.get_phase(p)
-            if p_obj.is_vapor_phase():
-                # Vapor leaves through Vap outlet
-                split_map[p] = "Vap"
-            else:
-                # All other phases leave through Liq outlet
-                split_map[p] = "Liq"
+        # Vapor phases leave through the Vap outlet; all other phases leave
+        # through the Liq outlet
+        # Intern the phase names so later lookups in the Separator's component
+        # dicts compare against the "Vap"/"Liq" literals by pointer
+        split_map = {
+            sys.intern(p): "Vap" if params.get_phase(p).is_vapor_phase() else "Liq"
+            for p in params.phase_list
+        }
 
         self.split = Separator(
+            **_SEPARATOR_STATIC_ARGS,
             property_package=self.config.property_package,
             property_package_args=self.config.property_package_args,
-            outlet_list=["Vap", "Liq"],
-            split_basis=SplittingType.phaseFlow,
             ideal_separation=self.config.ideal_separation,
             ideal_split_map=split_map,
             mixed_state_block=self.control_volume.properties_out,
@@ -290,18 +314,24 @@ see property package for documentation.}""",
         self.liq_outlet = Port(extends=self.split.Liq)
 
         # Add references
+        # Guard on the control volume actually holding the term, so a balance
+        # type which skips it cannot trigger the Block.__getattr__ fallback
         if (
-            self.config.has_heat_transfer is True
-            and self.config.energy_balance_type != EnergyBalanceType.none
+            self.config.has_heat_transfer
+            and self.config.energy_balance_type is not EnergyBalanceType.none
+            and hasattr(self.control_volume, "heat")
         ):
             self.heat_duty = Reference(self.control_volume.heat[:])
         if (
-            self.config.has_pressure_change is True
-            and self.config.momentum_balance_type != MomentumBalanceType.none
+            self.config.has_pressure_change
+            and self.config.momentum_balance_type is not MomentumBalanceType.none
+            and hasattr(self.control_volume, "deltaP")
         ):
             self.deltaP = Reference(self.control_volume.deltaP[:])
 
     def _get_performance_contents(self, time_point=0):
+        # Probe for the references, as build() may not create them; e.g. a
+        # useDefault balance type may resolve to none via the property package
         var_dict = {}
         if hasattr(self, "heat_duty"):
             var_dict["Heat Duty"] = self.heat_duty[time_point]
@@ -311,8 +341,11 @@ see property package for documentation.}""",
         return {"vars": var_dict}
 
     def _get_stream_table_contents(self, time_point=0):
+        # Deferred import - pandas is only needed when reporting stream tables
+        from pandas import DataFrame
+
         stream_attributes = {}
-        stream_attributes["Units"] = {}
+        units = stream_attributes["Units"] = {}
 
         sblocks = {
             "Inlet": self.control_volume.properties_in,
@@ -326,42 +359,60 @@ see property package for documentation.}""",
         for n, v in sblocks.items():
             dvars = v[time_point].define_display_vars()
 
-            stream_attributes[n] = {}
+            col = stream_attributes[n] = {}
 
-            for k in dvars:
-                for i in dvars[k].keys():
-                    stream_key = k if i is None else f"{k} {i}"
+            for k, dvars_k in dvars.items():
+                # Scalar display vars yield a single None index; handle them
+                # directly and skip the general indexing loop
+                if len(dvars_k) == 1 and None in dvars_k:
+                    quant = report_quantity(dvars_k[None])
 
-                    quant = report_quantity(dvars[k][i])
+                    col[k] = quant.m
+                    units[k] = quant.u
+                    continue
 
-                    stream_attributes[n][stream_key] = quant.m
-                    stream_attributes["Units"][stream_key] = quant.u
+                # Batch the indexed members through map, so the Python-level
+                # loop only unpacks the reported quantities
+                stream_keys = [k if i is None else f"{k} {i}" for i in dvars_k]
+                quants = map(report_quantity, (dvars_k[i] for i in dvars_k))
+
+                for stream_key, quant in zip(stream_keys, quants):
+                    col[stream_key] = quant.m
+                    units[stream_key] = quant.u
 
         if self.config.ideal_separation:
             # If using ideal separation, get values from Ports and hope they map
             # to names in Inlet
             # TODO: Add a better way to map these if necessary
-            for n, v in {
-                "Vapor Outlet": "vap_outlet",
-                "Liquid Outlet": "liq_outlet",
-            }.items():
+            for n, v in self._STREAM_ATTR_MAP:
                 port_obj = getattr(self, v)
 
-                stream_attributes[n] = {}
+                col = stream_attributes[n] = {}
 
                 for k in port_obj.vars:
-                    for i in port_obj.vars[k].keys():
+                    port_k = port_obj.vars[k]
+                    for i in port_k.keys():
                         if isinstance(i, float):
-                            quant = report_quantity(port_obj.vars[k][time_point])
-                            stream_attributes[n][k] = quant.m
-                            stream_attributes["Units"][k] = quant.u
+                            quant = report_quantity(port_k[time_point])
+                            col[k] = quant.m
+                            units[k] = quant.u
                         else:
                             if len(i) == 2:
                                 kname = str(i[1])
                             else:
                                 kname = str(i[1:])
-                            quant = report_quantity(port_obj.vars[k][time_point, i[1:]])
-                            stream_attributes[n][k + " " + kname] = quant.m
-                            stream_attributes["Units"][k + " " + kname] = quant.u
+                            stream_key = f"{k} {kname}"
+                            quant = report_quantity(port_k[time_point, i[1:]])
+                            col[stream_key] = quant.m
+                            units[stream_key] = quant.u
+
+        # Every stream key is also recorded in the units row, so its keys give
+        # the row labels in insertion order; building the frame from prebuilt
+        # columns skips from_dict's per-key alignment walk
+        rows = list(units)
+        data = {
+            n: [col.get(r, float("nan")) for r in rows]
+            for n, col in stream_attributes.items()
+        }
 
-        return DataFrame.from_dict(stream_attributes, orient="columns")
+        return DataFrame(data, index=rows)
@@ -40,6 +40,7 @@ from idaes.core.util.model_statistics import (
     number_total_constraints,
     number_unused_variables,
 )
+from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.util.testing import PhysicalParameterTestBlock, initialization_tester
 from idaes.core.solvers import get_solver
 import idaes.core.util.scaling as iscale
@@ -91,6 +92,45 @@ def test_calc_scale():
     iscale.calculate_scaling_factors(m)
 
 
+# -----------------------------------------------------------------------------
+@pytest.mark.unit
+def test_single_phase_package():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+
+    m.fs.properties = BTXParameterBlock(valid_phase="Liq", activity_coeff_model="Ideal")
+
+    with pytest.raises(
+        ConfigurationError,
+        match="fs.unit Flash units must be used with property packages "
+        "which define at least two phases",
+    ):
+        m.fs.unit = Flash(property_package=m.fs.properties)
+
+
+# -----------------------------------------------------------------------------
+@pytest.mark.unit
+def test_balance_type_none_no_references():
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=False)
+
+    m.fs.properties = PhysicalParameterTestBlock()
+
+    m.fs.unit = Flash(
+        property_package=m.fs.properties,
+        energy_balance_type=EnergyBalanceType.none,
+        momentum_balance_type=MomentumBalanceType.none,
+    )
+
+    # The transfer flags default to True, but with no balance equations the
+    # control volume holds no heat or deltaP terms to reference
+    assert not hasattr(m.fs.unit, "heat_duty")
+    assert not hasattr(m.fs.unit, "deltaP")
+
+    # Reporting must tolerate the absent references
+    assert m.fs.unit._get_performance_contents() == {"vars": {}}
+
+
 # -----------------------------------------------------------------------------
 class TestBTXIdeal(object):
     @pytest.fixture(scope="class")